@@ -105,8 +105,8 @@ def normalize(position):
 
     """
     x, y, z = position
-    x, y, z = (int(round(x)), int(round(y)), int(round(z)))
-    return (x, y, z)
+    # round() with no ndigits already returns an int on Python 3.
+    return (round(x), round(y), round(z))
 
 
 def sectorize(position):
@@ -146,7 +146,7 @@ class Model(object):
         # Mapping from position to a pyglet `VertextList` for all shown blocks.
         self._shown = {}
 
-        # Mapping from sector to a list of positions inside that sector.
+        # Mapping from sector to a set of positions inside that sector.
         self.sectors = {}
 
         # Simple function queue implementation. The queue is populated with
@@ -183,11 +183,13 @@ class Model(object):
             d = 1  # how quickly to taper off the hills
             t = random.choice([GRASS, SAND, BRICK])
             for y in xrange(c, c + h):
+                r = (s + 1) * (s + 1)  # squared radius of this layer
                 for x in xrange(a - s, a + s + 1):
+                    dx = (x - a) * (x - a)  # constant along the z loop below
                     for z in xrange(b - s, b + s + 1):
-                        if (x - a) ** 2 + (z - b) ** 2 > (s + 1) ** 2:
+                        if dx + (z - b) * (z - b) > r:
                             continue
-                        if (x - 0) ** 2 + (z - 0) ** 2 < 5 ** 2:
+                        if x * x + z * z < 5 * 5:
                             continue
                         self.add_block((x, y, z), t, immediate=False)
                 s -= d  # decrement side length so hills taper off
@@ -210,13 +212,15 @@ class Model(object):
         m = 8
         x, y, z = position
         dx, dy, dz = vector
+        # The step along the line of sight is the same on every iteration.
+        dx, dy, dz = dx / m, dy / m, dz / m
         previous = None
         for _ in xrange(max_distance * m):
             key = normalize((x, y, z))
             if key != previous and key in self.world:
                 return key, previous
             previous = key
-            x, y, z = x + dx / m, y + dy / m, z + dz / m
+            x, y, z = x + dx, y + dy, z + dz
         return None, None
 
     def exposed(self, position):
@@ -245,9 +249,14 @@ class Model(object):
 
         """
         if position in self.world:
+            if not immediate:
+                # Nothing is redrawn for a deferred overwrite and the position
+                # stays in the same sector, so only the texture changes.
+                self.world[position] = texture
+                return
             self.remove_block(position, immediate)
         self.world[position] = texture
-        self.sectors.setdefault(sectorize(position), []).append(position)
+        self.sectors.setdefault(sectorize(position), set()).add(position)
         if immediate:
             if self.exposed(position):
                 self.show_block(position)
@@ -359,7 +368,7 @@ class Model(object):
         drawn to the canvas.
 
         """
-        for position in self.sectors.get(sector, []):
+        for position in self.sectors.get(sector, ()):
             if position not in self.shown and self.exposed(position):
                 self.show_block(position, False)
 
@@ -368,7 +377,7 @@ class Model(object):
         removed from the canvas.
 
         """
-        for position in self.sectors.get(sector, []):
+        for position in self.sectors.get(sector, ()):
             if position in self.shown:
                 self.hide_block(position, False)
 